@@ -15,16 +15,11 @@ bl_info = {
 }
 
 import bpy
+import importlib.util
 
-# Check for python-osc
-OSC_AVAILABLE = False
-OSC_ERROR = ""
-
-try:
-    from pythonosc import udp_client
-    OSC_AVAILABLE = True
-except ImportError as e:
-    OSC_ERROR = str(e)
+# Check for python-osc (without importing it, keeps add-on load fast)
+OSC_AVAILABLE = importlib.util.find_spec("pythonosc") is not None
+OSC_ERROR = "" if OSC_AVAILABLE else "No module named 'pythonosc'"
 
 
 def register():
@@ -3,22 +3,19 @@
 #
 
 import bpy
+import array
+import importlib.util
 import math
+import socket
+import struct
+import threading
+import traceback
 from bpy.types import Operator
-from mathutils import Vector
 from typing import Dict, Optional
 
-# OSC Import
-try:
-    from pythonosc import udp_client
-    from pythonosc import osc_bundle_builder
-    from pythonosc import osc_message_builder
-    OSC_OK = True
-except ImportError:
-    udp_client = None
-    osc_bundle_builder = None
-    osc_message_builder = None
-    OSC_OK = False
+# OSC Import - python-osc is only needed once per target to encode the
+# bundle header, so it is located here and imported on first use
+OSC_OK = importlib.util.find_spec("pythonosc") is not None
 
 
 # ============================================================================
@@ -31,6 +28,70 @@ def blender_to_ossia_coords(vec):
     return (x, z, -y)
 
 
+# ============================================================================
+# OSC Templates
+# ============================================================================
+
+def _osc_pad(s: str) -> bytes:
+    """Encode an OSC string: null terminated, padded to 4 bytes"""
+    data = s.encode()
+    return (data + b"\0\0\0\0")[:(len(data) + 4) & ~3]
+
+
+_TYPETAG3 = _osc_pad(",fff")
+_TYPETAG1 = _osc_pad(",f")
+
+_bundle_header: Optional[bytes] = None
+
+
+def osc_bundle_header() -> bytes:
+    """"#bundle\0" + immediate timetag, encoded by python-osc on first use"""
+    global _bundle_header
+    if _bundle_header is None:
+        from pythonosc import osc_bundle_builder
+        bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+        _bundle_header = bundle.build().dgram
+    return _bundle_header
+
+
+def open_osc_socket(host: str, port: int, send_buffer_kb: int) -> tuple:
+    """Open a UDP socket for host:port, returns (socket, resolved address)"""
+    family, type_, proto, _, sockaddr = socket.getaddrinfo(
+        host, port, type=socket.SOCK_DGRAM)[0]
+    sock = socket.socket(family, type_, proto)
+    # Larger send buffer so bursts (playback, scrubbing) don't drop bundles.
+    # Best effort: Linux clamps to net.core.wmem_max, macOS refuses sizes
+    # above kern.ipc.maxsockbuf (ENOBUFS) - keep the default then, so
+    # nothing can fail between creating the socket and returning it.
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, send_buffer_kb * 1024)
+    except OSError as e:
+        print(f"[OSC Camera] Could not set send buffer to {send_buffer_kb} KB: {e}")
+    # Not connected: on a connected socket an ICMP port unreachable (receiver
+    # not started yet) fails the next send. Resolved once, sent with sendto().
+    return sock, sockaddr
+
+
+# Bound packers for the float payloads (one C call per message)
+_PACK3 = struct.Struct(">fff").pack_into
+_PACK1 = struct.Struct(">f").pack_into
+
+# Messages in bundle order (position, center, fov, near, far) as
+# (first, end) index into the flat state plus their payload packer
+_MSG_FIELDS = (
+    (0, 3, _PACK3),
+    (3, 6, _PACK3),
+    (6, 7, _PACK1),
+    (7, 8, _PACK1),
+    (8, 9, _PACK1),
+)
+_ALL_MESSAGES = (1 << len(_MSG_FIELDS)) - 1  # Bitmask, bit i = _MSG_FIELDS[i]
+
+# Reused assembly buffer of the sender thread. Five messages with a
+# 256 character prefix (OscCameraSettings.address_prefix) stay well below.
+_SEND_BUFFER_SIZE = 4096
+
+
 # ============================================================================
 # Camera OSC Sync
 # ============================================================================
@@ -38,42 +99,275 @@ def blender_to_ossia_coords(vec):
 class CameraOscTarget:
     """Represents an active OSC camera sync"""
     
-    def __init__(self, object_name: str, client, address_prefix: str, 
-                 look_distance: float, send_bundled: bool):
+    def __init__(self, object_name: str, sock: socket.socket, sockaddr: tuple,
+                 address_prefix: str, look_distance: float, send_bundled: bool, send_rate_hz: float,
+                 change_threshold: float):
         self.object_name = object_name
-        self.client = client
+        # Direct references instead of per-send name lookups
+        self.obj = bpy.data.objects[object_name]
+        self.cam_data = self.obj.data
+        self._sock = sock
+        self._sockaddr = sockaddr
         self.address_prefix = address_prefix.rstrip('/')  # Remove trailing slash
         self.look_distance = look_distance
         self.send_bundled = send_bundled
-        self.last_data = None  # Cache to avoid sending duplicates
+        self.send_interval = 1.0 / send_rate_hz
+        # Set by depsgraph updates, cleared by the flush timer
+        self._dirty_transform = False
+        self._dirty_intrinsics = False
+        self.change_threshold = change_threshold
+        # Last sent state (see _send_state), NaN forces the first send
+        self.last_data = array.array('f', [math.nan] * 9)
+        self.last_intrinsics = None  # (angle, clip_start, clip_end) as last sent
+        # msgbus owner of the subscriptions on the camera data, so they can
+        # be replaced without touching the ones on the object
+        self._data_owner = object()
+        self._data_resubscribe = False  # Set when obj.data was reassigned
+        self._build_templates()
+    
+    def _rebuild_addresses(self):
+        """msgbus callback - re-encode the templates after the prefix was edited"""
+        try:
+            self.address_prefix = self.cam_data.osc_camera.address_prefix.rstrip('/')
+        except ReferenceError:
+            CameraOscSyncer._mark_stale(self)
+            return
+        with CameraOscSyncer._cond:
+            self._build_templates()
+            # The new buffer holds no values yet - drop the pending mask
+            # and resend everything under the new addresses
+            CameraOscSyncer._pending.pop(self, None)
+            self.last_data = array.array('f', [math.nan] * 9)
+        self._dirty_transform = self._dirty_intrinsics = True
+    
+    def _build_templates(self):
+        """Pre-encode the bundle so a send only has to pack the floats"""
+        prefix = self.address_prefix
+        self._addr_position = _osc_pad(f"{prefix}/position")
+        self._addr_center = _osc_pad(f"{prefix}/center")
+        self._addr_fov = _osc_pad(f"{prefix}/fov")
+        self._addr_near = _osc_pad(f"{prefix}/near")
+        self._addr_far = _osc_pad(f"{prefix}/far")
+        
+        # Message header: address + typetag
+        self._pos_hdr = self._addr_position + _TYPETAG3
+        self._ctr_hdr = self._addr_center + _TYPETAG3
+        self._fov_hdr = self._addr_fov + _TYPETAG1
+        self._near_hdr = self._addr_near + _TYPETAG1
+        self._far_hdr = self._addr_far + _TYPETAG1
+        
+        # Individual messages don't need the bundle header
+        self._bundle_prefix = osc_bundle_header() if self.send_bundled else b""
+        
+        # Bundle layout: prefix, then [size, header, args] per message.
+        # _arg_offsets point at the float payloads, _msg_spans at the
+        # complete messages (used when not sending bundled).
+        buf = bytearray(self._bundle_prefix)
+        self._arg_offsets = []
+        self._msg_spans = []
+        for header, argc in ((self._pos_hdr, 3), (self._ctr_hdr, 3),
+                             (self._fov_hdr, 1), (self._near_hdr, 1),
+                             (self._far_hdr, 1)):
+            size = len(header) + 4 * argc
+            buf += struct.pack(">i", size)
+            start = len(buf)
+            buf += header
+            self._arg_offsets.append(len(buf))
+            buf += bytes(4 * argc)
+            self._msg_spans.append((start, start + size))
+        self._datagram = buf
+    
+    def _assemble(self, mask: int, out: bytearray) -> list:
+        """Write the messages selected by mask into out, return the datagram spans"""
+        src = memoryview(self._datagram)
+        if self.send_bundled:
+            if mask == _ALL_MESSAGES:
+                size = len(src)
+                out[:size] = src
+                return [(0, size)]
+            offset = len(self._bundle_prefix)
+            out[:offset] = self._bundle_prefix
+            for i, (start, end) in enumerate(self._msg_spans):
+                if mask & (1 << i):
+                    # Bundle elements start with their size field
+                    size = end - start + 4
+                    out[offset:offset + size] = src[start - 4:end]
+                    offset += size
+            return [(0, offset)]
+        
+        spans = []
+        offset = 0
+        for i, (start, end) in enumerate(self._msg_spans):
+            if mask & (1 << i):
+                size = end - start
+                out[offset:offset + size] = src[start:end]
+                spans.append((offset, offset + size))
+                offset += size
+        return spans
 
 
 class CameraOscSyncer:
     """Manages camera OSC sync"""
     
     targets: Dict[str, CameraOscTarget] = {}
+    _camera_data_targets: Dict[str, CameraOscTarget] = {}  # Camera data name -> target
     _handler_registered = False
+    _timer = None  # Registered flush callback (timers are matched by identity)
+    # Latest-value-wins hand-off to the sender thread: at most one pending
+    # entry per target, newer changes are merged into it. The condition
+    # also guards the targets' template buffers.
+    _cond = threading.Condition()
+    _pending: Dict[CameraOscTarget, int] = {}  # target -> message bitmask
+    _closing: list = []  # Sockets to close once their last send is done
+    _sender_thread: Optional[threading.Thread] = None
     
     @classmethod
     def add_target(cls, target: CameraOscTarget):
         cls.targets[target.object_name] = target
+        cls._camera_data_targets[target.cam_data.name] = target
+        cls._subscribe(target)
+        
         cls._ensure_handler()
+        cls._ensure_sender()
         # Send initial data
-        cls._send_camera_data(target)
+        target._dirty_transform = target._dirty_intrinsics = True
+        try:
+            cls._send_dirty(target)
+        except Exception:
+            # Leave nothing registered if the operator reports a failure
+            cls.remove_target(target.object_name)
+            raise
     
     @classmethod
     def remove_target(cls, object_name: str):
-        if object_name in cls.targets:
-            del cls.targets[object_name]
+        target = cls.targets.pop(object_name, None)
+        if target is not None:
+            bpy.msgbus.clear_by_owner(target)
+            bpy.msgbus.clear_by_owner(target._data_owner)
+            # Closed by the sender thread, which may still be using it
+            with cls._cond:
+                cls._pending.pop(target, None)
+                cls._closing.append(target._sock)
+                cls._cond.notify()
+        
+        for data_name, data_target in list(cls._camera_data_targets.items()):
+            if data_target is target:
+                del cls._camera_data_targets[data_name]
         
         if not cls.targets:
             cls._remove_handler()
+            cls._stop_sender()
+    
+    @classmethod
+    def _subscribe(cls, target: CameraOscTarget):
+        """Keep the cached references and lookup keys of a target current"""
+        bpy.msgbus.clear_by_owner(target)
+        # Follow renames of the object so the cached reference stays keyed
+        bpy.msgbus.subscribe_rna(
+            key=target.obj.path_resolve("name", False),
+            owner=target,
+            args=(target,),
+            notify=cls._on_object_renamed,
+        )
+        # Camera data reassigned: follow the new data-block
+        bpy.msgbus.subscribe_rna(
+            key=target.obj.path_resolve("data", False),
+            owner=target,
+            args=(target,),
+            notify=cls._on_camera_data_changed,
+        )
+        cls._subscribe_data(target)
+    
+    @classmethod
+    def _subscribe_data(cls, target: CameraOscTarget):
+        """(Re)subscribe to the current camera data-block of a target"""
+        # Never call this from a msgbus callback - clearing the owner frees
+        # the subscription that is being notified
+        bpy.msgbus.clear_by_owner(target._data_owner)
+        target._data_resubscribe = False
+        # Camera data renamed: update the reverse lookup
+        bpy.msgbus.subscribe_rna(
+            key=target.cam_data.path_resolve("name", False),
+            owner=target._data_owner,
+            args=(target,),
+            notify=cls._on_camera_data_renamed,
+        )
+        # Editing the prefix while syncing only re-encodes the templates
+        bpy.msgbus.subscribe_rna(
+            key=target.cam_data.osc_camera.path_resolve("address_prefix", False),
+            owner=target._data_owner,
+            args=(target,),
+            notify=CameraOscTarget._rebuild_addresses,
+        )
+    
+    @classmethod
+    def _rekey_camera_data(cls, target: CameraOscTarget, data_name: str):
+        """Point the reverse lookup of a target at its current data name"""
+        for name, data_target in list(cls._camera_data_targets.items()):
+            if data_target is target:
+                del cls._camera_data_targets[name]
+        cls._camera_data_targets[data_name] = target
+    
+    @classmethod
+    def _on_camera_data_changed(cls, target: CameraOscTarget):
+        """msgbus callback - follow a reassigned camera data-block"""
+        try:
+            cam_data = target.obj.data
+            data_name = cam_data.name
+        except ReferenceError:
+            cls._mark_stale(target)
+            return
+        
+        cls._rekey_camera_data(target, data_name)
+        target.cam_data = cam_data
+        target._dirty_intrinsics = True
+        # Subscriptions on the old data-block no longer apply, the flush
+        # timer replaces them outside of this callback
+        target._data_resubscribe = True
+    
+    @classmethod
+    def _on_camera_data_renamed(cls, target: CameraOscTarget):
+        """msgbus callback - re-key a target after its camera data was renamed"""
+        try:
+            data_name = target.cam_data.name
+        except ReferenceError:
+            cls._mark_stale(target)
+            return
+        
+        cls._rekey_camera_data(target, data_name)
+    
+    @staticmethod
+    def _mark_stale(target: CameraOscTarget):
+        """Leave a stale reference seen in a msgbus callback to the flush timer"""
+        # _handle_stale resubscribes, which must not happen while notifying.
+        # Sending both parts hits the stale reference again in _send_dirty.
+        target._dirty_transform = target._dirty_intrinsics = True
+    
+    @classmethod
+    def _on_object_renamed(cls, target: CameraOscTarget):
+        """msgbus callback - re-key a target after its object was renamed"""
+        old_name = target.object_name
+        try:
+            new_name = target.obj.name
+        except ReferenceError:
+            cls._mark_stale(target)
+            return
+        
+        if new_name == old_name or cls.targets.get(old_name) is not target:
+            return
+        
+        del cls.targets[old_name]
+        cls.targets[new_name] = target
+        target.object_name = new_name
     
     @classmethod
     def _ensure_handler(cls):
         if not cls._handler_registered:
             bpy.app.handlers.depsgraph_update_post.append(cls._depsgraph_callback)
             cls._handler_registered = True
+        if cls._timer is None:
+            cls._timer = cls._flush
+            bpy.app.timers.register(cls._timer, persistent=True)
     
     @classmethod
     def _remove_handler(cls):
@@ -83,6 +377,89 @@ class CameraOscSyncer:
             except:
                 pass
             cls._handler_registered = False
+        if cls._timer is not None:
+            if bpy.app.timers.is_registered(cls._timer):
+                bpy.app.timers.unregister(cls._timer)
+            cls._timer = None
+    
+    @classmethod
+    def _ensure_sender(cls):
+        if cls._sender_thread is None:
+            cls._sender_thread = threading.Thread(
+                target=cls._drain, name="OSC Camera Sender", daemon=True)
+            cls._sender_thread.start()
+    
+    @classmethod
+    def _stop_sender(cls):
+        with cls._cond:
+            cls._sender_thread = None
+            cls._cond.notify_all()
+    
+    @classmethod
+    def _drain(cls):
+        """Sender thread - keeps socket I/O off Blender's main thread"""
+        me = threading.current_thread()
+        cond = cls._cond
+        # One buffer per sender thread, only ever touched here, so a
+        # thread still finishing after a restart can't clobber it
+        buf = bytearray(_SEND_BUFFER_SIZE)
+        view = memoryview(buf)
+        while True:
+            sock = None
+            with cond:
+                while not (cls._pending or cls._closing or cls._sender_thread is not me):
+                    cond.wait()
+                closing, cls._closing = cls._closing, []
+                if cls._pending:
+                    # Oldest first - popitem() is LIFO and would starve
+                    # a target while others keep updating
+                    target = next(iter(cls._pending))
+                    mask = cls._pending.pop(target)
+                    sock = target._sock
+                    sockaddr = target._sockaddr
+                    spans = target._assemble(mask, buf)
+                stop = cls._sender_thread is not me and not cls._pending
+            
+            for closed in closing:
+                closed.close()
+            if sock is not None:
+                for start, end in spans:
+                    cls._safe_send(sock, view[start:end], sockaddr)
+            if stop:
+                return
+    
+    @staticmethod
+    def _safe_send(sock: socket.socket, datagram: memoryview, sockaddr: tuple):
+        """Send one datagram - UDP errors (e.g. full buffer) are reported, not raised"""
+        try:
+            sock.sendto(datagram, sockaddr)
+        except OSError as e:
+            print(f"[OSC Camera] Error sending data: {e}")
+    
+    @classmethod
+    def _flush(cls):
+        """Timer callback - send the latest state of all dirty targets"""
+        if not cls.targets:
+            cls._timer = None
+            return None
+        
+        # Errors are reported here: raising out of a timer callback would
+        # unregister it and stop the sync for good
+        for target in list(cls.targets.values()):
+            # Skip targets dropped while flushing an earlier one
+            if cls.targets.get(target.object_name) is target:
+                try:
+                    cls._send_dirty(target)
+                except Exception:
+                    print(f"[OSC Camera] Error sending {target.object_name}:")
+                    traceback.print_exc()
+        
+        # Stale references may have removed the last target
+        if not cls.targets:
+            return None
+        
+        # Runs at the rate of the fastest active target
+        return min(target.send_interval for target in cls.targets.values())
     
     @classmethod
     def _depsgraph_callback(cls, scene, depsgraph):
@@ -90,104 +467,156 @@ class CameraOscSyncer:
         if not cls.targets:
             return
         
+        targets = cls.targets
+        camera_targets = cls._camera_data_targets
+        
         for update in depsgraph.updates:
-            obj_name = None
+            id_ = update.id
+            name = id_.name
             
-            # Check for Object or Camera data updates
-            if isinstance(update.id, bpy.types.Object):
-                if update.id.type == 'CAMERA':
-                    obj_name = update.id.name
-            elif isinstance(update.id, bpy.types.Camera):
-                # Find the object using this camera data
-                for obj in bpy.data.objects:
-                    if obj.type == 'CAMERA' and obj.data == update.id:
-                        obj_name = obj.name
-                        break
+            # Cheap name probe first - most updates are unrelated datablocks
+            if name not in targets and name not in camera_targets:
+                continue
             
-            if obj_name and obj_name in cls.targets:
-                target = cls.targets[obj_name]
+            # Object and its camera data often share a name, so the
+            # id type decides which kind of update this is
+            id_type = id_.id_type
+            if id_type == 'OBJECT':
+                target = targets.get(name)
+                # Only transform/geometry changes can move the camera
+                if target is not None and (update.is_updated_transform or
+                                           update.is_updated_geometry):
+                    # Coalesced - the flush timer sends the most recent state
+                    target._dirty_transform = True
+            elif id_type == 'CAMERA':
+                target = camera_targets.get(name)
+                # Skip camera data updates that don't touch lens or clipping
+                if target is not None and target.last_intrinsics != (
+                        id_.angle, id_.clip_start, id_.clip_end):
+                    target._dirty_intrinsics = True
+    
+    @classmethod
+    def _send_dirty(cls, target: CameraOscTarget):
+        """Send whichever parameters of the target were marked dirty"""
+        transform = target._dirty_transform
+        intrinsics = target._dirty_intrinsics
+        target._dirty_transform = target._dirty_intrinsics = False
+        try:
+            # Deferred from _on_camera_data_changed
+            if target._data_resubscribe:
+                cls._subscribe_data(target)
+            if transform and intrinsics:
                 cls._send_camera_data(target)
+            elif transform:
+                cls._send_transform(target)
+            elif intrinsics:
+                cls._send_intrinsics(target)
+        except ReferenceError:
+            cls._handle_stale(target)
+    
+    @classmethod
+    def _handle_stale(cls, target: CameraOscTarget):
+        """Re-resolve invalidated references (undo), drop the target if deleted"""
+        obj = bpy.data.objects.get(target.object_name)
+        if obj is not None and obj.type == 'CAMERA':
+            target.obj = obj
+            target.cam_data = obj.data
+            cls._rekey_camera_data(target, obj.data.name)
+            cls._subscribe(target)
+            # Values may have been restored as well
+            target._dirty_transform = target._dirty_intrinsics = True
+            return
+        
+        # Object was deleted (or a new file loaded) - reset the panel state
+        # through the camera data, looked up by name as the reference is stale
+        data_names = [name for name, data_target in cls._camera_data_targets.items()
+                      if data_target is target]
+        cls.remove_target(target.object_name)
+        for name in data_names:
+            camera = bpy.data.cameras.get(name)
+            if camera is not None:
+                camera.osc_camera.active = False
     
     @classmethod
     def _send_camera_data(cls, target: CameraOscTarget):
-        """Send camera parameters via OSC"""
-        try:
-            obj = bpy.data.objects.get(target.object_name)
-            if obj is None or obj.type != 'CAMERA':
-                return
-            
-            cam_data = obj.data
-            
-            # Position (direkt aus location, wie im funktionierenden Script)
-            blender_pos = tuple(obj.location)
-            ossia_pos = blender_to_ossia_coords(blender_pos)
-            
-            # Center berechnen (Kamera schaut in -Z Richtung lokal)
-            forward = obj.matrix_world.to_quaternion() @ Vector((0, 0, -1))
-            blender_center = tuple(obj.location + forward * target.look_distance)
-            ossia_center = blender_to_ossia_coords(blender_center)
-            
-            # FOV (in Grad, ossia verwendet vertikales FOV)
-            fov = math.degrees(cam_data.angle)
-            
-            # Clipping
-            near = cam_data.clip_start
-            far = cam_data.clip_end
-            
-            # Create data tuple for comparison
-            current_data = (ossia_pos, ossia_center, fov, near, far)
-            
-            # Skip if data hasn't changed (avoid OSC spam)
-            if target.last_data == current_data:
-                return
-            target.last_data = current_data
-            
-            prefix = target.address_prefix
+        """Send all camera parameters via OSC"""
+        state = cls._transform_state(target) + cls._intrinsics_state(target)
+        cls._send_state(target, state, 0)
+    
+    @classmethod
+    def _send_transform(cls, target: CameraOscTarget):
+        """Send position and center via OSC"""
+        cls._send_state(target, cls._transform_state(target), 0)
+    
+    @classmethod
+    def _send_intrinsics(cls, target: CameraOscTarget):
+        """Send fov, near and far via OSC"""
+        cls._send_state(target, cls._intrinsics_state(target), 6)
+    
+    @staticmethod
+    def _transform_state(target: CameraOscTarget) -> tuple:
+        """Position xyz + center xyz in ossia coordinates"""
+        # Position und Center direkt aus matrix_world: Spalte 3 ist die
+        # Translation, Spalte 2 die lokale Z-Achse (Kamera schaut in -Z)
+        mw = target.obj.matrix_world
+        lx, ly, lz = mw[0][3], mw[1][3], mw[2][3]
+        zx, zy, zz = mw[0][2], mw[1][2], mw[2][2]
+        # Normalisieren, damit Objekt-Skalierung die Distanz nicht verzerrt
+        # (auf 0 skalierte Kamera: unnormalisiert, Center = Position)
+        length = math.sqrt(zx * zx + zy * zy + zz * zz) or 1.0
+        d = -target.look_distance / length
+        fx, fy, fz = zx * d, zy * d, zz * d
+        
+        # Blender Z-up -> ossia Y-up: (x, y, z) -> (x, z, -y)
+        return (lx, lz, -ly, lx + fx, lz + fz, -(ly + fy))
+    
+    @staticmethod
+    def _intrinsics_state(target: CameraOscTarget) -> tuple:
+        """FOV in degrees, near and far clipping"""
+        cam_data = target.cam_data
+        
+        # FOV (in Grad, ossia verwendet vertikales FOV)
+        angle = cam_data.angle
+        near = cam_data.clip_start
+        far = cam_data.clip_end
+        target.last_intrinsics = (angle, near, far)
+        
+        return (math.degrees(angle), near, far)
+    
+    @classmethod
+    def _send_state(cls, target: CameraOscTarget, values: tuple, first: int):
+        """Send the messages covered by values, starting at state index first"""
+        # Flat float32 state as it goes on the wire:
+        # position xyz, center xyz, fov, near, far.
+        current = array.array('f', values)
+        end = first + len(current)
+        
+        # Only messages whose values moved beyond FP noise are sent
+        # (avoid OSC spam). The threshold is relative above 1.0: a float32
+        # ulp grows with the value (about 6e-5 at 1000 units), so an
+        # absolute one would let jitter through at large coordinates.
+        # NaN in the initial state never compares within threshold
+        # (max() keeps 1.0), so the first send has every message.
+        eps = target.change_threshold
+        last = target.last_data
+        with cls._cond:
+            buf = target._datagram
+            changed = 0
+            for i, (lo, hi, pack_into) in enumerate(_MSG_FIELDS):
+                if lo < first or hi > end:
+                    continue
+                if all(abs(current[j - first] - last[j]) <= eps * max(1.0, abs(last[j]))
+                       for j in range(lo, hi)):
+                    continue
+                last[lo:hi] = current[lo - first:hi - first]
+                pack_into(buf, target._arg_offsets[i], *current[lo - first:hi - first])
+                changed |= 1 << i
             
-            if target.send_bundled:
-                # Send as OSC bundle (atomic)
-                bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
-                
-                # Position
-                msg = osc_message_builder.OscMessageBuilder(address=f"{prefix}/position")
-                msg.add_arg(float(ossia_pos[0]))
-                msg.add_arg(float(ossia_pos[1]))
-                msg.add_arg(float(ossia_pos[2]))
-                bundle.add_content(msg.build())
-                
-                # Center
-                msg = osc_message_builder.OscMessageBuilder(address=f"{prefix}/center")
-                msg.add_arg(float(ossia_center[0]))
-                msg.add_arg(float(ossia_center[1]))
-                msg.add_arg(float(ossia_center[2]))
-                bundle.add_content(msg.build())
-                
-                # FOV
-                msg = osc_message_builder.OscMessageBuilder(address=f"{prefix}/fov")
-                msg.add_arg(float(fov))
-                bundle.add_content(msg.build())
-                
-                # Near
-                msg = osc_message_builder.OscMessageBuilder(address=f"{prefix}/near")
-                msg.add_arg(float(near))
-                bundle.add_content(msg.build())
-                
-                # Far
-                msg = osc_message_builder.OscMessageBuilder(address=f"{prefix}/far")
-                msg.add_arg(float(far))
-                bundle.add_content(msg.build())
-                
-                target.client.send(bundle.build())
-            else:
-                # Send as individual messages
-                target.client.send_message(f"{prefix}/position", list(ossia_pos))
-                target.client.send_message(f"{prefix}/center", list(ossia_center))
-                target.client.send_message(f"{prefix}/fov", fov)
-                target.client.send_message(f"{prefix}/near", near)
-                target.client.send_message(f"{prefix}/far", far)
-                
-        except Exception as e:
-            print(f"[OSC Camera] Error sending data: {e}")
+            if changed:
+                # Merge with a not yet sent update, the buffer already
+                # holds the newest values for every message in the mask
+                cls._pending[target] = cls._pending.get(target, 0) | changed
+                cls._cond.notify()
 
 
 # ============================================================================
@@ -220,17 +649,26 @@ class OSC_OT_camera_sync(Operator):
         else:
             # Start sync
             try:
-                # Create OSC client
-                client = udp_client.SimpleUDPClient(settings.host, settings.port)
+                # Create OSC socket
+                sock, sockaddr = open_osc_socket(settings.host, settings.port,
+                                                 settings.send_buffer_kb)
                 
-                target = CameraOscTarget(
-                    object_name=obj.name,
-                    client=client,
-                    address_prefix=settings.address_prefix,
-                    look_distance=settings.look_distance,
-                    send_bundled=settings.send_bundled
-                )
+                try:
+                    target = CameraOscTarget(
+                        object_name=obj.name,
+                        sock=sock,
+                        sockaddr=sockaddr,
+                        address_prefix=settings.address_prefix,
+                        look_distance=settings.look_distance,
+                        send_bundled=settings.send_bundled,
+                        send_rate_hz=settings.send_rate_hz,
+                        change_threshold=settings.change_threshold
+                    )
+                except Exception:
+                    sock.close()
+                    raise
                 
+                # Closes the socket itself if it fails
                 CameraOscSyncer.add_target(target)
                 settings.active = True
                 
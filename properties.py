@@ -31,6 +31,14 @@ class OscCameraSettings(bpy.types.PropertyGroup):
         max=65535
     )
     
+    send_buffer_kb: IntProperty(
+        name="Send Buffer (KB)",
+        description="Requested socket send buffer size (SO_SNDBUF), applied when sync starts. The OS may cap it or keep its default",
+        default=1024,
+        min=64,
+        max=65536
+    )
+    
     address_prefix: StringProperty(
         name="Address Prefix",
         description="OSC address prefix (e.g. /camera results in /camera/position, /camera/fov, etc.)",
@@ -51,6 +59,23 @@ class OscCameraSettings(bpy.types.PropertyGroup):
         description="Send all parameters as a single OSC bundle (atomic update)",
         default=True
     )
+    
+    send_rate_hz: FloatProperty(
+        name="Send Rate (Hz)",
+        description="Maximum update rate, changes in between are coalesced",
+        default=60.0,
+        min=1.0,
+        max=240.0
+    )
+    
+    change_threshold: FloatProperty(
+        name="Change Threshold",
+        description="Minimum change of any value before an update is sent, relative to the value above 1.0",
+        default=1e-5,
+        min=0.0,
+        max=1.0,
+        precision=6
+    )
 
 
 class OSC_PT_camera_panel(bpy.types.Panel):
@@ -94,6 +119,7 @@ class OSC_PT_camera_panel(bpy.types.Panel):
         col = box.column(align=True)
         col.prop(settings, "host")
         col.prop(settings, "port")
+        col.prop(settings, "send_buffer_kb")
         
         # OSC settings
         box = layout.box()
@@ -101,6 +127,8 @@ class OSC_PT_camera_panel(bpy.types.Panel):
         col = box.column(align=True)
         col.prop(settings, "address_prefix")
         col.prop(settings, "send_bundled")
+        col.prop(settings, "send_rate_hz")
+        col.prop(settings, "change_threshold")
         
         # Camera settings
         box = layout.box()